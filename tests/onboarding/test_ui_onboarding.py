@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from datetime import UTC, datetime
+import os
 from pathlib import Path
+import threading
 import tomllib
 from typing import cast
 
@@ -15,6 +17,7 @@ from textual.events import Resize
 from textual.geometry import Size
 from textual.pilot import Pilot
 from textual.screen import Screen
+from textual.visual import VisualType
 from textual.widget import Widget
 from textual.widgets import Input, Link, Static
 
@@ -167,6 +170,22 @@ def _saved_env_contents() -> str:
     return GLOBAL_ENV_FILE.path.read_text(encoding="utf-8")
 
 
+def _block_keyring_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[threading.Event, threading.Event, dict[str, str]]:
+    write_started = threading.Event()
+    release_write = threading.Event()
+    stored: dict[str, str] = {}
+
+    def _slow_set_password(service: str, username: str, password: str) -> None:
+        write_started.set()
+        release_write.wait(timeout=5)
+        stored[username] = password
+
+    monkeypatch.setattr(keyring, "set_password", _slow_set_password)
+    return write_started, release_write, stored
+
+
 def _browser_sign_in_step_cards(screen: Screen) -> list[Widget]:
     return list(screen.query(".browser-sign-in-step"))
 
@@ -1254,6 +1273,152 @@ async def test_ui_manual_api_key_screen_uses_configured_vibe_url() -> None:
     assert provider_link.url == "https://vibe.example.com/code/extensions?focus=key"
 
 
+@pytest.mark.asyncio
+async def test_ui_api_key_feedback_only_repaints_when_validation_outcome_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    feedback_updates: list[VisualType] = []
+    original_update = NoMarkupStatic.update
+
+    def record_update(
+        self: NoMarkupStatic, content: VisualType = "", *, layout: bool = True
+    ) -> None:
+        if self.id == "feedback":
+            feedback_updates.append(content)
+        original_update(self, content, layout=layout)
+
+    monkeypatch.setattr(NoMarkupStatic, "update", record_update)
+    app = OnboardingApp(
+        config=_build_onboarding_config(
+            browser_auth_base_url="", browser_auth_api_base_url=""
+        )
+    )
+
+    async with app.run_test() as pilot:
+        await _pass_welcome_screen(pilot)
+        await _pass_theme_selection_screen(pilot)
+        await _wait_for(lambda: isinstance(pilot.app.screen, ApiKeyScreen), pilot)
+        feedback_updates.clear()
+
+        await pilot.press(*"sk-key")
+        await pilot.press(*["backspace"] * len("sk-key"))
+        await pilot.pause()
+
+        feedback = app.screen.query_one("#feedback", NoMarkupStatic)
+
+    assert len(feedback_updates) == 2
+    assert feedback_updates[-1] == "No API key provided."
+    assert feedback.has_class("error")
+
+
+@pytest.mark.asyncio
+async def test_ui_ignores_cancel_while_manual_api_key_is_being_saved(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    write_started, release_write, stored = _block_keyring_write(monkeypatch)
+    app = OnboardingApp(
+        config=_build_onboarding_config(
+            browser_auth_base_url="", browser_auth_api_base_url=""
+        )
+    )
+
+    async with app.run_test() as pilot:
+        await _pass_welcome_screen(pilot)
+        await _pass_theme_selection_screen(pilot)
+        await _wait_for(lambda: isinstance(pilot.app.screen, ApiKeyScreen), pilot)
+        await pilot.press(*"sk-slow-keyring-key")
+        await pilot.press("enter")
+        await _wait_for(write_started.is_set, pilot)
+        await pilot.press("escape", "ctrl+c")
+        assert app.return_value is None
+        release_write.set()
+        await _wait_for(lambda: app.return_value is not None, pilot, timeout=2.0)
+
+    assert app.return_value == "completed"
+    assert stored == {"MISTRAL_API_KEY": "sk-slow-keyring-key"}
+    assert os.environ["MISTRAL_API_KEY"] == "sk-slow-keyring-key"
+
+
+@pytest.mark.asyncio
+async def test_ui_allows_cancel_after_manual_api_key_save_is_interrupted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    write_started, release_write, _ = _block_keyring_write(monkeypatch)
+    app = OnboardingApp(
+        config=_build_onboarding_config(
+            browser_auth_base_url="", browser_auth_api_base_url=""
+        )
+    )
+    exit_results: list[str | None] = []
+    monkeypatch.setattr(app, "exit", exit_results.append)
+
+    async with app.run_test() as pilot:
+        await _pass_welcome_screen(pilot)
+        await _pass_theme_selection_screen(pilot)
+        await _wait_for(lambda: isinstance(pilot.app.screen, ApiKeyScreen), pilot)
+        screen = app.screen
+        assert isinstance(screen, ApiKeyScreen)
+        await pilot.press(*"sk-slow-keyring-key")
+        await pilot.press("enter")
+        await _wait_for(write_started.is_set, pilot)
+
+        screen.workers.cancel_group(screen, "api-key-save")
+        await _wait_for(lambda: not screen.input_widget.disabled, pilot)
+        release_write.set()
+        await pilot.press("escape")
+
+    assert exit_results == [None]
+
+
+@pytest.mark.asyncio
+async def test_ui_ignores_cancel_while_browser_api_key_is_being_saved(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    write_started, release_write, stored = _block_keyring_write(monkeypatch)
+    _, browser_sign_in_service_factory, _ = build_browser_sign_in_service_factory(
+        outcomes=["completed"]
+    )
+    app = _build_browser_onboarding_app(
+        browser_sign_in_service_factory=browser_sign_in_service_factory
+    )
+
+    async with app.run_test() as pilot:
+        await _show_browser_sign_in(pilot)
+        await _wait_for(write_started.is_set, pilot)
+        await pilot.press("m", "escape")
+        assert isinstance(app.screen, BrowserSignInScreen)
+        assert app.return_value is None
+        release_write.set()
+        await _wait_for(lambda: app.return_value is not None, pilot, timeout=2.0)
+
+    assert app.return_value == "completed"
+    assert stored == {"MISTRAL_API_KEY": "sk-browser-onboarding-test-key"}
+
+
+@pytest.mark.asyncio
+async def test_ui_rejects_api_key_containing_whitespace_without_saving() -> None:
+    app = OnboardingApp(
+        config=_build_onboarding_config(
+            browser_auth_base_url="", browser_auth_api_base_url=""
+        )
+    )
+
+    async with app.run_test() as pilot:
+        await _pass_welcome_screen(pilot)
+        await _pass_theme_selection_screen(pilot)
+        await _wait_for(lambda: isinstance(pilot.app.screen, ApiKeyScreen), pilot)
+        await pilot.press(*"curl -H sk-key")
+        await pilot.press("enter")
+        await pilot.pause()
+
+        feedback = app.screen.query_one("#feedback", NoMarkupStatic)
+        assert str(feedback.render()) == "API key must not contain whitespace."
+        assert feedback.has_class("error")
+        assert app.return_value is None
+
+    assert not GLOBAL_ENV_FILE.path.exists()
+
+
 def test_persist_api_key_returns_save_error_for_invalid_env_var_name() -> None:
     provider = ProviderConfig(
         name="custom", api_base="https://custom.example/v1", api_key_env_var="BAD=NAME"
@@ -1310,3 +1475,31 @@ def test_persist_api_key_sends_onboarding_telemetry_with_launch_context(
     assert recorded_metadata["client_version"] == "1.0.0"
     assert recorded_metadata["terminal_emulator"] == "apple_terminal"
     assert "session_id" not in recorded_metadata
+
+
+@pytest.mark.asyncio
+async def test_ui_strips_whitespace_surrounding_pasted_api_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stored: dict[str, str] = {}
+    monkeypatch.setattr(
+        keyring,
+        "set_password",
+        lambda service, username, password: stored.__setitem__(username, password),
+    )
+    app = OnboardingApp(
+        config=_build_onboarding_config(
+            browser_auth_base_url="", browser_auth_api_base_url=""
+        )
+    )
+
+    async with app.run_test() as pilot:
+        await _pass_welcome_screen(pilot)
+        await _pass_theme_selection_screen(pilot)
+        await _wait_for(lambda: isinstance(pilot.app.screen, ApiKeyScreen), pilot)
+        await pilot.press(*" sk-copied-key ")
+        await pilot.press("enter")
+        await _wait_for(lambda: app.return_value is not None, pilot, timeout=2.0)
+
+    assert app.return_value == "completed"
+    assert stored == {"MISTRAL_API_KEY": "sk-copied-key"}
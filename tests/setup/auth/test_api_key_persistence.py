@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import threading
 
 from dotenv import dotenv_values, set_key
 import keyring
@@ -10,7 +11,11 @@ import pytest
 from vibe.core.config import ProviderConfig, resolve_api_key
 from vibe.core.paths import GLOBAL_ENV_FILE
 from vibe.core.types import Backend
-from vibe.setup.auth.api_key_persistence import persist_api_key, remove_api_key
+from vibe.setup.auth.api_key_persistence import (
+    persist_api_key,
+    persist_api_key_async,
+    remove_api_key,
+)
 
 
 def _provider(*, api_key_env_var: str = "CUSTOM_API_KEY") -> ProviderConfig:
@@ -99,6 +104,28 @@ def test_persist_fallback_clears_stale_cached_keyring_value(
     assert resolve_api_key("CUSTOM_API_KEY") is None
 
 
+@pytest.mark.asyncio
+async def test_persist_async_stores_key_off_the_event_loop_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    storing_threads: list[threading.Thread] = []
+    monkeypatch.delenv("CUSTOM_API_KEY", raising=False)
+    monkeypatch.setattr(
+        keyring,
+        "set_password",
+        lambda service, username, password: storing_threads.append(
+            threading.current_thread()
+        ),
+    )
+
+    result = await persist_api_key_async(_provider(), "new-key")
+
+    assert result == "completed"
+    assert os.environ["CUSTOM_API_KEY"] == "new-key"
+    assert storing_threads
+    assert threading.current_thread() not in storing_threads
+
+
 def test_persist_returns_env_var_error_for_empty_env_var(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
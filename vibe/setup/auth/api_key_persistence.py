@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 
 from dotenv import set_key, unset_key
@@ -44,12 +45,7 @@ def resolve_api_key_provider(provider: ProviderConfig | None = None) -> Provider
     return _get_mistral_provider()
 
 
-def persist_api_key(
-    provider: ProviderConfig,
-    api_key: str,
-    *,
-    launch_context: LaunchContext | None = None,
-) -> str:
+def _store_api_key(provider: ProviderConfig, api_key: str) -> str:
     env_key = provider.api_key_env_var
     if not env_key:
         return "env_var_error:<empty>"
@@ -72,17 +68,49 @@ def persist_api_key(
             logger.error(
                 "Failed to remove stale plaintext API key from env file", exc_info=err
             )
-    if provider.backend == Backend.MISTRAL:
-        try:
-            telemetry = TelemetryClient(
-                config_getter=VibeConfig, launch_context=launch_context
-            )
-            telemetry.send_onboarding_api_key_added()
-        except Exception:
-            pass
     return "completed"
 
 
+def _send_api_key_added_telemetry(
+    provider: ProviderConfig, launch_context: LaunchContext | None
+) -> None:
+    if provider.backend != Backend.MISTRAL:
+        return
+    try:
+        telemetry = TelemetryClient(
+            config_getter=VibeConfig, launch_context=launch_context
+        )
+        telemetry.send_onboarding_api_key_added()
+    except Exception:
+        pass
+
+
+def persist_api_key(
+    provider: ProviderConfig,
+    api_key: str,
+    *,
+    launch_context: LaunchContext | None = None,
+) -> str:
+    result = _store_api_key(provider, api_key)
+    if result == "completed":
+        _send_api_key_added_telemetry(provider, launch_context)
+    return result
+
+
+async def persist_api_key_async(
+    provider: ProviderConfig,
+    api_key: str,
+    *,
+    launch_context: LaunchContext | None = None,
+) -> str:
+    # Keyring backends may block on a subprocess or D-Bus call, so storage runs
+    # off the event loop; telemetry schedules an asyncio task and must stay on it.
+    result = await asyncio.to_thread(_store_api_key, provider, api_key)
+    if result == "completed":
+        _send_api_key_added_telemetry(provider, launch_context)
+    return result
+
+
 def remove_api_key(provider: ProviderConfig) -> None:
     env_key = provider.api_key_env_var
     if not env_key:
@@ -6,7 +6,7 @@ from textual.app import ComposeResult
 from textual.binding import Binding, BindingType
 from textual.containers import Center, Vertical
 from textual.events import MouseUp
-from textual.validation import Length
+from textual.validation import Function, Regex
 from textual.widgets import Input, Link
 
 from vibe.cli.clipboard import copy_selection_to_clipboard
@@ -16,7 +16,7 @@ from vibe.cli.textual_ui.widgets.no_markup_static import NoMarkupStatic
 from vibe.core.config import DEFAULT_VIBE_BASE_URL, ProviderConfig
 from vibe.core.telemetry.types import LaunchContext
 from vibe.setup.auth.api_key_persistence import (
-    persist_api_key,
+    persist_api_key_async,
     resolve_api_key_provider,
 )
 from vibe.setup.onboarding.base import OnboardingScreen
@@ -47,6 +47,10 @@ class ApiKeyScreen(OnboardingScreen):
         self.provider = resolve_api_key_provider(provider)
         self._vibe_base_url = vibe_base_url
         self._launch_context = launch_context
+        self._shown_feedback: tuple[bool, list[str]] | None = None
+        self._saving = False
+        self._feedback: NoMarkupStatic
+        self._input_box: Vertical
 
     def _compose_provider_link(self) -> ComposeResult:
         if self.provider.name != MISTRAL_PROVIDER_NAME:
@@ -72,7 +76,16 @@ class ApiKeyScreen(OnboardingScreen):
         self.input_widget = Input(
             password=True,
             id="key",
-            validators=[Length(minimum=1, failure_description="No API key provided.")],
+            validators=[
+                Function(
+                    lambda value: bool(value.strip()),
+                    failure_description="No API key provided.",
+                ),
+                Regex(
+                    r"\s*\S*\s*",
+                    failure_description="API key must not contain whitespace.",
+                ),
+            ],
         )
         input_box = Vertical(
             self.input_widget, id="input-box", classes="onboarding-card"
@@ -98,37 +111,69 @@ class ApiKeyScreen(OnboardingScreen):
                     yield from self._compose_config_docs()
 
     def on_mount(self) -> None:
+        self._feedback = self.query_one("#feedback", NoMarkupStatic)
+        self._input_box = self.query_one("#input-box", Vertical)
         self.input_widget.focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        feedback = self.query_one("#feedback", NoMarkupStatic)
-        input_box = self.query_one("#input-box")
-
         if event.validation_result is None:
             return
 
-        input_box.remove_class("valid", "invalid")
-        feedback.remove_class("error", "success")
+        # Only the first failure is rendered, so keystrokes that keep the same
+        # outcome would repaint identical feedback.
+        is_valid = event.validation_result.is_valid
+        failures = event.validation_result.failure_descriptions[:1]
+        if (is_valid, failures) == self._shown_feedback:
+            return
+        self._shown_feedback = (is_valid, failures)
+
+        with self.app.batch_update():
+            self._apply_feedback(is_valid, failures)
+
+    def _apply_feedback(self, is_valid: bool, failures: list[str]) -> None:
+        self._input_box.remove_class("valid", "invalid")
+        self._feedback.remove_class("error", "success")
 
-        if event.validation_result.is_valid:
-            feedback.update(shortcut_hint(f"Press {shortcut('Enter')} to submit ↵"))
-            feedback.add_class("success")
-            input_box.add_class("valid")
+        if is_valid:
+            self._feedback.update(
+                shortcut_hint(f"Press {shortcut('Enter')} to submit ↵")
+            )
+            self._feedback.add_class("success")
+            self._input_box.add_class("valid")
             return
 
-        descriptions = event.validation_result.failure_descriptions
-        feedback.update(descriptions[0])
-        feedback.add_class("error")
-        input_box.add_class("invalid")
+        self._feedback.update(failures[0])
+        self._feedback.add_class("error")
+        self._input_box.add_class("invalid")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
+        if self._saving:
+            return
         if event.validation_result and event.validation_result.is_valid:
-            self._save_and_finish(event.value)
-
-    def _save_and_finish(self, api_key: str) -> None:
-        self.app.exit(
-            persist_api_key(self.provider, api_key, launch_context=self._launch_context)
-        )
+            self._saving = True
+            self.input_widget.disabled = True
+            self.run_worker(
+                self._save_and_finish(event.value.strip()),
+                group="api-key-save",
+                exclusive=True,
+            )
+
+    async def _save_and_finish(self, api_key: str) -> None:
+        try:
+            result = await persist_api_key_async(
+                self.provider, api_key, launch_context=self._launch_context
+            )
+        finally:
+            self._saving = False
+            self.input_widget.disabled = False
+        self.app.exit(result)
+
+    def action_cancel(self) -> None:
+        # The key is being written off-thread and cannot be rolled back, so a
+        # cancel now would report "Setup cancelled" for a key that got saved.
+        if self._saving:
+            return
+        super().action_cancel()
 
     def on_mouse_up(self, event: MouseUp) -> None:
         copy_selection_to_clipboard(self.app)
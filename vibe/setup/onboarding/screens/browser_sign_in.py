@@ -32,7 +32,7 @@ from vibe.setup.auth import (
     BrowserSignInStatusChanged,
 )
 from vibe.setup.auth.api_key_persistence import (
-    persist_api_key,
+    persist_api_key_async,
     resolve_api_key_provider,
 )
 from vibe.setup.onboarding.base import OnboardingScreen
@@ -144,6 +144,7 @@ class BrowserSignInScreen(OnboardingScreen):
         self._attempt_number = 0
         self._active_attempt_number: int | None = None
         self._worker: Worker[None] | None = None
+        self._saving = False
         self._gradient_offset = 0
         self._gradient_timer: Timer | None = None
         self._sign_in_url_help_timer: Timer | None = None
@@ -214,13 +215,13 @@ class BrowserSignInScreen(OnboardingScreen):
             self._start_browser_sign_in()
 
     def action_manual(self) -> None:
-        if self.state.variant == "success":
+        if self._saving or self.state.variant == "success":
             return
         self._cancel_current_attempt()
         self.app.switch_screen("api_key")
 
     def action_cancel(self) -> None:
-        if self.state.variant == "success":
+        if self._saving or self.state.variant == "success":
             return
         self._cancel_current_attempt()
         super().action_cancel()
@@ -307,11 +308,15 @@ class BrowserSignInScreen(OnboardingScreen):
         if api_key is None:
             msg = "Browser sign-in finished without returning an API key."
             raise AssertionError(msg)
-        result = persist_api_key(
-            resolve_api_key_provider(self.provider),
-            api_key,
-            launch_context=self._launch_context,
-        )
+        self._saving = True
+        try:
+            result = await persist_api_key_async(
+                resolve_api_key_provider(self.provider),
+                api_key,
+                launch_context=self._launch_context,
+            )
+        finally:
+            self._saving = False
         self._cancel_sign_in_url_help_timer()
         if result != "completed":
             self._active_attempt_number = None